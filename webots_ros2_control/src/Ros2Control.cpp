@@ -92,12 +92,13 @@ namespace webots_ros2_control {
     const int periodMs = nowMs - mLastControlUpdateMs;
     if (periodMs >= mControlPeriodMs) {
       const rclcpp::Duration dt = rclcpp::Duration::from_seconds(mControlPeriodMs / 1000.0);
-      mControllerManager->read(mNode->get_clock()->now(), dt);
+      const rclcpp::Time now = mNode->get_clock()->now();
+      mControllerManager->read(now, dt);
 
-      mControllerManager->update(mNode->get_clock()->now(), dt);
+      mControllerManager->update(now, dt);
       mLastControlUpdateMs = nowMs;
 
-      mControllerManager->write(mNode->get_clock()->now(), dt);
+      mControllerManager->write(now, dt);
     }
   }
   void Ros2Control::init(webots_ros2_driver::WebotsNode *node, std::unordered_map<std::string, std::string> &) {
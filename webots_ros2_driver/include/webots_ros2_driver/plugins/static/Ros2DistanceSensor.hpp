@@ -36,6 +36,8 @@ namespace webots_ros2_driver {
     rclcpp::Publisher<sensor_msgs::msg::Range>::SharedPtr mPublisher;
     sensor_msgs::msg::Range mMessage;
     std::vector<double> mLookupTable;
+    std::vector<double> mLookupTableCoefficients;
+    bool mIsLookupTableIdentity;
 
     bool mIsEnabled;
   };
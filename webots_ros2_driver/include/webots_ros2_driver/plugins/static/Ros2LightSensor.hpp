@@ -30,13 +30,14 @@ namespace webots_ros2_driver {
 
   private:
     void publishValue();
-    double findVariance(double rawValue);
+    double findVariance(double rawValue, double illuminance);
 
     WbDeviceTag mLightSensor;
 
     rclcpp::Publisher<sensor_msgs::msg::Illuminance>::SharedPtr mPublisher;
     sensor_msgs::msg::Illuminance mMessage;
     std::vector<double> mLookupTable;
+    std::vector<double> mLookupTableCoefficients;
 
     bool mIsEnabled;
   };
@@ -25,5 +25,7 @@ namespace webots_ros2_driver {
   void quaternionToAxisAngle(const geometry_msgs::msg::Quaternion &q, double *axisAngle);
 
   double interpolateLookupTable(double value, const std::vector<double> &table);
+  void precomputeLookupTableCoefficients(const std::vector<double> &table, std::vector<double> &coefficients);
+  double interpolateLookupTable(double value, const std::vector<double> &table, const std::vector<double> &coefficients);
 }  // namespace webots_ros2_driver
 #endif
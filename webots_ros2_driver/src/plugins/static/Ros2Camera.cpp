@@ -107,13 +107,13 @@ namespace webots_ros2_driver {
       mRecognitionIsEnabled = recognitionSubscriptionsExist;
     }
 
-    // Publish data
+    // Publish data, the camera info is published along with the images when there are any
     if (mAlwaysOn || imageSubscriptionsExist)
       publishImage();
+    else if (mCameraInfoPublisher->get_subscription_count() > 0)
+      mCameraInfoPublisher->publish(mCameraInfoMessage);
     if (recognitionSubscriptionsExist)
       publishRecognition();
-    if (mCameraInfoPublisher->get_subscription_count() > 0)
-      mCameraInfoPublisher->publish(mCameraInfoMessage);
   }
 
   void Ros2Camera::publishImage() {
@@ -123,6 +123,8 @@ namespace webots_ros2_driver {
       mCameraInfoMessage.header.stamp = mImageMessage.header.stamp;
       memcpy(mImageMessage.data.data(), image, mImageMessage.data.size());
       mImagePublisher->publish(mImageMessage);
+      if (mCameraInfoPublisher->get_subscription_count() > 0)
+        mCameraInfoPublisher->publish(mCameraInfoMessage);
     }
   }
 
@@ -132,10 +134,18 @@ namespace webots_ros2_driver {
 
     auto objects = wb_camera_recognition_get_objects(mCamera);
     mRecognitionMessage.header.stamp = mNode->get_clock()->now();
-    mWebotsRecognitionMessage.header.stamp = mNode->get_clock()->now();
+    mWebotsRecognitionMessage.header.stamp = mRecognitionMessage.header.stamp;
     mRecognitionMessage.detections.clear();
     mWebotsRecognitionMessage.objects.clear();
 
+    // Transform to ROS camera coordinate frame, shared by all the objects
+    // rpy = (0, pi/2, -pi/2)
+    geometry_msgs::msg::TransformStamped transform;
+    transform.transform.rotation.x = 0.5;
+    transform.transform.rotation.y = -0.5;
+    transform.transform.rotation.z = 0.5;
+    transform.transform.rotation.w = 0.5;
+
     for (size_t i = 0; i < wb_camera_recognition_get_number_of_objects(mCamera); i++) {
       // Getting Object Info
       geometry_msgs::msg::PoseStamped pose;
@@ -145,12 +155,6 @@ namespace webots_ros2_driver {
       axisAngleToQuaternion(objects[i].orientation, pose.pose.orientation);
 
       // Transform to ROS camera coordinate frame
-      // rpy = (0, pi/2, -pi/2)
-      geometry_msgs::msg::TransformStamped transform;
-      transform.transform.rotation.x = 0.5;
-      transform.transform.rotation.y = -0.5;
-      transform.transform.rotation.z = 0.5;
-      transform.transform.rotation.w = 0.5;
       tf2::doTransform(pose, pose, transform);
 
       // Object Info -> Detection2D
@@ -30,6 +30,15 @@ namespace webots_ros2_driver {
     mLookupTable.assign(
       wb_distance_sensor_get_lookup_table(mDistanceSensor),
       wb_distance_sensor_get_lookup_table(mDistanceSensor) + wb_distance_sensor_get_lookup_table_size(mDistanceSensor) * 3);
+    precomputeLookupTableCoefficients(mLookupTable, mLookupTableCoefficients);
+
+    // The interpolation is skipped if the lookup table already returns the distance in meters
+    mIsLookupTableIdentity = true;
+    for (int i = 0; i < (int)mLookupTable.size(); i += 3)
+      if (mLookupTable[i] != mLookupTable[i + 1]) {
+        mIsLookupTableIdentity = false;
+        break;
+      }
 
     const int size = mLookupTable.size();
     const double maxValue = std::max(mLookupTable[0], mLookupTable[size - 3]);
@@ -80,7 +89,7 @@ namespace webots_ros2_driver {
     if (std::isnan(value))
       return;
     mMessage.header.stamp = mNode->get_clock()->now();
-    mMessage.range = interpolateLookupTable(value, mLookupTable);
+    mMessage.range = mIsLookupTableIdentity ? value : interpolateLookupTable(value, mLookupTable, mLookupTableCoefficients);
     mPublisher->publish(mMessage);
   }
 }  // namespace webots_ros2_driver
@@ -34,6 +34,7 @@ namespace webots_ros2_driver {
     mLookupTable.assign(
       wb_light_sensor_get_lookup_table(mLightSensor),
       wb_light_sensor_get_lookup_table(mLightSensor) + wb_light_sensor_get_lookup_table_size(mLightSensor) * 3);
+    precomputeLookupTableCoefficients(mLookupTable, mLookupTableCoefficients);
 
     if (mAlwaysOn) {
       wb_light_sensor_enable(mLightSensor, mPublishTimestepSyncedMs);
@@ -65,12 +66,12 @@ namespace webots_ros2_driver {
   void Ros2LightSensor::publishValue() {
     const double value = wb_light_sensor_get_value(mLightSensor);
     mMessage.header.stamp = mNode->get_clock()->now();
-    mMessage.illuminance = interpolateLookupTable(value, mLookupTable);
-    mMessage.variance = findVariance(value);
+    mMessage.illuminance = interpolateLookupTable(value, mLookupTable, mLookupTableCoefficients);
+    mMessage.variance = findVariance(value, mMessage.illuminance);
     mPublisher->publish(mMessage);
   }
 
-  double Ros2LightSensor::findVariance(double rawValue) {
+  double Ros2LightSensor::findVariance(double rawValue, double illuminance) {
     // Find relative standard deviation in lookup table
     double relativeStd = NAN;
     for (int i = 0; i < mLookupTable.size() - 3; i += 3)
@@ -86,7 +87,7 @@ namespace webots_ros2_driver {
         relativeStd = mLookupTable[-1];
 
     // Calculate variance from the relative standard deviation
-    double std = interpolateLookupTable(rawValue, mLookupTable) * gIrradianceToIlluminance * relativeStd;
+    double std = illuminance * gIrradianceToIlluminance * relativeStd;
     return std * std;
   }
 }  // namespace webots_ros2_driver
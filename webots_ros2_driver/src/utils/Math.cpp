@@ -115,24 +115,60 @@ namespace webots_ros2_driver {
     return slope * (value - startX) + startY;
   }
 
+  static int findLookupTableSegment(double value, const std::vector<double> &table, bool ascending) {
+    // Binary search of the segment containing the value, values outside of the table fall in the first or the last segment
+    // so they are extrapolated (we assume that the table is sorted, order is irrelevant)
+    int low = 1;
+    int high = table.size() / 3 - 1;
+    while (low < high) {
+      const int middle = (low + high) / 2;
+      if ((ascending && value < table[middle * 3 + 1]) || (!ascending && value >= table[middle * 3 + 1]))
+        high = middle;
+      else
+        low = middle + 1;
+    }
+    return low;
+  }
+
   double interpolateLookupTable(double value, const std::vector<double> &table) {
     if (!table.size())
       return value;
     const int size = table.size();
 
-    // Interpolate
-    for (int i = 0; i < size / 3 - 1; i++) {
-      if ((value < table[i * 3 + 1] && value >= table[(i + 1) * 3 + 1]) ||
-          (value >= table[i * 3 + 1] && value < table[(i + 1) * 3 + 1]))
-        return interpolateFunction(value, table[i * 3 + 1], table[i * 3], table[(i + 1) * 3 + 1], table[(i + 1) * 3]);
+    const bool ascending = (table[1] < table[size - 1 * 3 + 1]);
+    const int i = findLookupTableSegment(value, table, ascending);
+    return interpolateFunction(value, table[(i - 1) * 3 + 1], table[(i - 1) * 3], table[i * 3 + 1], table[i * 3], ascending);
+  }
+
+  void precomputeLookupTableCoefficients(const std::vector<double> &table, std::vector<double> &coefficients) {
+    // Slope and intercept of each segment, the slope is NaN for vertical segments
+    coefficients.clear();
+    for (int i = 1; i < (int)table.size() / 3; i++) {
+      const double startX = table[(i - 1) * 3 + 1];
+      const double startY = table[(i - 1) * 3];
+      const double endX = table[i * 3 + 1];
+      const double endY = table[i * 3];
+      if (endX - startX == 0) {
+        coefficients.push_back(NAN);
+        coefficients.push_back(NAN);
+        continue;
+      }
+      const double slope = (endY - startY) / (endX - startX);
+      coefficients.push_back(slope);
+      coefficients.push_back(startY - slope * startX);
     }
+  }
+
+  double interpolateLookupTable(double value, const std::vector<double> &table, const std::vector<double> &coefficients) {
+    if (!table.size())
+      return value;
+    const int size = table.size();
 
-    // Extrapolate (we assume that the table is sorted, order is irrelevant)
     const bool ascending = (table[1] < table[size - 1 * 3 + 1]);
-    if ((ascending && value >= table[1]) || (!ascending && value < table[1]))
-      return interpolateFunction(value, table[size - 2 * 3 + 1], table[size - 2 * 3 + 0], table[size - 1 * 3 + 1],
-                                 table[size - 1 * 3 + 0], ascending);
-    else
-      return interpolateFunction(value, table[1], table[0], table[3 + 1], table[3], ascending);
+    const int i = findLookupTableSegment(value, table, ascending);
+    const double slope = coefficients[(i - 1) * 2];
+    if (std::isnan(slope))
+      return interpolateFunction(value, table[(i - 1) * 3 + 1], table[(i - 1) * 3], table[i * 3 + 1], table[i * 3], ascending);
+    return slope * value + coefficients[(i - 1) * 2 + 1];
   }
 }  // namespace webots_ros2_driver
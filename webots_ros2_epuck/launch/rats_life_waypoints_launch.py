@@ -27,7 +27,12 @@ from launch import LaunchDescription
 from ament_index_python.packages import get_package_share_directory
 from launch_ros.actions import Node
 from launch.actions import ExecuteProcess
-from geometry_msgs.msg import Quaternion
+
+
+def yaw_to_quaternion(yaw):
+    """Return the quaternion of a rotation around the z-axis only, the x and y components are always zero."""
+    half_yaw = yaw / 2
+    return {'x': 0.0, 'y': 0.0, 'z': sin(half_yaw), 'w': cos(half_yaw)}
 
 
 class WaypointCollection:
@@ -39,10 +44,7 @@ class WaypointCollection:
 
     def add(self, position=None, orientation=None):
         if orientation is not None:
-            q = Quaternion()
-            q.z = sin(orientation / 2)
-            q.w = cos(orientation / 2)
-            orientation = {'x': q.x, 'y': q.y, 'z': q.z, 'w': q.w}
+            orientation = yaw_to_quaternion(orientation)
         if position is not None:
             position = {'x': position[0], 'y': position[1], 'z': 0}
         if position is None:
@@ -42,6 +42,7 @@ class EPuckDriveCalibrator(Node):
         # Topics
         self.create_subscription(Odometry, '/odom', self.odometry_callback, 1)
         self.pub = self.create_publisher(Twist, '/cmd_vel', 10)
+        self.velocity_message = Twist()
 
         # Odometry
         self.odom_angular_last = 0.0
@@ -58,13 +59,9 @@ class EPuckDriveCalibrator(Node):
         sys.exit(0)
 
     def set_velocity(self, linear, angular):
-        msg = Twist()
-        msg.angular.x = 0.0
-        msg.angular.y = 0.0
+        msg = self.velocity_message
         msg.angular.z = float(angular)
         msg.linear.x = float(linear)
-        msg.linear.y = 0.0
-        msg.linear.z = 0.0
         self.pub.publish(msg)
 
     def odometry_callback(self, msg: Odometry):
@@ -90,19 +87,19 @@ class EPuckDriveCalibrator(Node):
 
         # Angular calibration
         if self.type.value == 'angular':
-            self.get_logger().info('Angular calibration in progress...')
+            self.get_logger().info('Angular calibration in progress...', once=True)
             self.set_velocity(0, ANGULAR_VELOCITY)
             n_rotations = (self.odom_angular_last_abs - self.odom_angular_start)/(2*pi)
             if n_rotations > NUMBER_OF_ROTATIONS:
                 self.finish_calibration()
-            self.get_logger().info(f'Number of rotations: {n_rotations:.4f}')
+            self.get_logger().info(f'Number of rotations: {n_rotations:.4f}', throttle_duration_sec=1.0)
 
         # Linear calibration
         if self.type.value == 'linear':
-            self.get_logger().info('Linear calibration in progress...')
+            self.get_logger().info('Linear calibration in progress...', once=True)
             self.set_velocity(LINEAR_VELOCITY, 0)
             passed_distance = msg.pose.pose.position.x - self.odom_linear_start
-            self.get_logger().info(f'Passed distance: {passed_distance:.4f}')
+            self.get_logger().info(f'Passed distance: {passed_distance:.4f}', throttle_duration_sec=1.0)
             if passed_distance > self.distance.value:
                 self.finish_calibration()
 
@@ -31,6 +31,11 @@ TOF_MAX_RANGE = 1.0
 NB_INFRARED_SENSORS = 8
 SENSOR_DIST_FROM_CENTER = 0.035
 
+# A scan is not republished while the robot is still and its ranges did not change, unless the last one is too old
+LASER_SCAN_VELOCITY_TOLERANCE = 1e-5
+LASER_SCAN_RANGE_TOLERANCE = 0.001
+LASER_SCAN_MAX_PERIOD = 0.5
+
 
 DISTANCE_SENSOR_ANGLE = [
     -15 * pi / 180,   # ps0
@@ -43,6 +48,33 @@ DISTANCE_SENSOR_ANGLE = [
     15 * pi / 180,    # ps7
 ]
 
+# Index of the range published at each LaserScan angle: an infrared sensor, the ToF sensor or no sensor
+TOF_RANGE_INDEX = NB_INFRARED_SENSORS
+NO_SENSOR_RANGE_INDEX = NB_INFRARED_SENSORS + 1
+LASER_SCAN_RANGE_INDICES = [
+    3,                      # -150
+    NO_SENSOR_RANGE_INDEX,  # -135
+    NO_SENSOR_RANGE_INDEX,  # -120
+    NO_SENSOR_RANGE_INDEX,  # -105
+    2,                      # -90
+    NO_SENSOR_RANGE_INDEX,  # -75
+    NO_SENSOR_RANGE_INDEX,  # -60
+    1,                      # -45
+    NO_SENSOR_RANGE_INDEX,  # -30
+    0,                      # -15
+    TOF_RANGE_INDEX,        # 0
+    7,                      # 15
+    NO_SENSOR_RANGE_INDEX,  # 30
+    6,                      # 45
+    NO_SENSOR_RANGE_INDEX,  # 60
+    NO_SENSOR_RANGE_INDEX,  # 75
+    5,                      # 90
+    NO_SENSOR_RANGE_INDEX,  # 105
+    NO_SENSOR_RANGE_INDEX,  # 120
+    NO_SENSOR_RANGE_INDEX,  # 135
+    4,                      # 150
+]
+
 
 class EPuckNode(Node):
     def __init__(self):
@@ -50,22 +82,29 @@ class EPuckNode(Node):
         self.get_logger().info("Epuck node has been started.")
 
         # Intialize distance sensors for LaserScan topic
-        self.__subscriber_dist_sensors = {}
-        self.__distances = {}
-        self.__tof_value = OUT_OF_RANGE
-        for i in range(NB_INFRARED_SENSORS):
-            self.__distances['ps{}'.format(i)] = OUT_OF_RANGE
+        self.__subscriber_dist_sensors = []
+        # Ranges of the infrared sensors, of the ToF sensor and of the angles without sensor, in this order.
+        # They are stored already offset from the center of the laser scanner (see `LASER_SCAN_RANGE_INDICES`).
+        self.__ranges = [OUT_OF_RANGE + SENSOR_DIST_FROM_CENTER] * (NB_INFRARED_SENSORS + 1) + [OUT_OF_RANGE]
 
         for i in range(NB_INFRARED_SENSORS):
-            self.__subscriber_dist_sensors['ps{}'.format(i)] = \
+            self.__subscriber_dist_sensors.append(
                 self.create_subscription(Range,
                                          '/ps{}'.format(i),
                                          partial(self.__on_distance_sensor_message, i),
-                                         1)
+                                         1))
 
         self.__subscriber_tof = self.create_subscription(Range, '/tof', self.__process_tof, 1)
 
         self.laser_publisher = self.create_publisher(LaserScan, '/scan', 1)
+        self.__laser_message = LaserScan()
+        self.__laser_message.header.frame_id = 'laser_scanner'
+        self.__laser_message.angle_min = - 150 * pi / 180
+        self.__laser_message.angle_max = 150 * pi / 180
+        self.__laser_message.angle_increment = 15 * pi / 180
+        self.__laser_message.range_min = SENSOR_DIST_FROM_CENTER + INFRARED_MIN_RANGE
+        self.__laser_message.range_max = SENSOR_DIST_FROM_CENTER + TOF_MAX_RANGE
+        self.__last_laser_time = None
 
         self.__now = self.get_clock().now().to_msg()
 
@@ -86,63 +125,40 @@ class EPuckNode(Node):
 
         # Main loop self.get_clock
         # self.create_timer(50 / 1000, self.__publish_laserscan_data)
-        self.__subscriber_tof = self.create_subscription(Odometry, '/odom', self.__publish_laserscan_data, 1)
+        self.__subscriber_odom = self.create_subscription(Odometry, '/odom', self.__publish_laserscan_data, 1)
 
     def __on_distance_sensor_message(self, i, msg):
-        self.__distances['ps{}'.format(i)] = msg.range
+        self.__ranges[i] = self.__laser_range(msg.range, INFRARED_MAX_RANGE)
 
         if i == 0:
             self.__now = msg.header.stamp
 
     def __process_tof(self, msg):
-        self.__tof_value = msg.range
-
-    def __publish_laserscan_data(self, msg_odom):
-        dists = [OUT_OF_RANGE] * NB_INFRARED_SENSORS
-        dist_tof = OUT_OF_RANGE
-
-        # Calculate distances
-        for i, key in enumerate(self.__distances):
-            dists[i] = self.__distances[key]
-
-        # Publish range: ToF
-        dist_tof = self.__tof_value
+        self.__ranges[TOF_RANGE_INDEX] = self.__laser_range(msg.range, TOF_MAX_RANGE)
 
+    @staticmethod
+    def __laser_range(dist, max_range):
         # Max range of ToF sensor is 2m so we put it as maximum laser range.
         # Therefore, for all invalid ranges we put 0 so it get deleted by rviz
-        laser_dists = [OUT_OF_RANGE if dist > INFRARED_MAX_RANGE else dist for dist in dists]
-        dist_tof = OUT_OF_RANGE if dist_tof > TOF_MAX_RANGE else dist_tof
-        msg = LaserScan()
-        msg.header.frame_id = 'laser_scanner'
+        return (OUT_OF_RANGE if dist > max_range else dist) + SENSOR_DIST_FROM_CENTER
+
+    def __publish_laserscan_data(self, msg_odom):
+        ranges = [self.__ranges[i] for i in LASER_SCAN_RANGE_INDICES]
+
+        # Skip the scan if nothing moved, but still publish it periodically for the nodes expecting a steady stream.
+        # A simulation time going backwards (Webots reset) counts as stale so the stream resumes right away.
+        msg = self.__laser_message
+        time = msg_odom.header.stamp.sec + msg_odom.header.stamp.nanosec * 1e-9
+        velocity = msg_odom.twist.twist
+        if self.__last_laser_time is not None and 0.0 <= time - self.__last_laser_time < LASER_SCAN_MAX_PERIOD and \
+                abs(velocity.linear.x) < LASER_SCAN_VELOCITY_TOLERANCE and \
+                abs(velocity.angular.z) < LASER_SCAN_VELOCITY_TOLERANCE and \
+                all(abs(new - old) < LASER_SCAN_RANGE_TOLERANCE for new, old in zip(ranges, msg.ranges)):
+            return
+        self.__last_laser_time = time
+
         msg.header.stamp = msg_odom.header.stamp
-        msg.angle_min = - 150 * pi / 180
-        msg.angle_max = 150 * pi / 180
-        msg.angle_increment = 15 * pi / 180
-        msg.range_min = SENSOR_DIST_FROM_CENTER + INFRARED_MIN_RANGE
-        msg.range_max = SENSOR_DIST_FROM_CENTER + TOF_MAX_RANGE
-        msg.ranges = [
-            laser_dists[3] + SENSOR_DIST_FROM_CENTER,   # -150
-            OUT_OF_RANGE,                               # -135
-            OUT_OF_RANGE,                               # -120
-            OUT_OF_RANGE,                               # -105
-            laser_dists[2] + SENSOR_DIST_FROM_CENTER,   # -90
-            OUT_OF_RANGE,                               # -75
-            OUT_OF_RANGE,                               # -60
-            laser_dists[1] + SENSOR_DIST_FROM_CENTER,   # -45
-            OUT_OF_RANGE,                               # -30
-            laser_dists[0] + SENSOR_DIST_FROM_CENTER,   # -15
-            dist_tof + SENSOR_DIST_FROM_CENTER,         # 0
-            laser_dists[7] + SENSOR_DIST_FROM_CENTER,   # 15
-            OUT_OF_RANGE,                               # 30
-            laser_dists[6] + SENSOR_DIST_FROM_CENTER,   # 45
-            OUT_OF_RANGE,                               # 60
-            OUT_OF_RANGE,                               # 75
-            laser_dists[5] + SENSOR_DIST_FROM_CENTER,   # 90
-            OUT_OF_RANGE,                               # 105
-            OUT_OF_RANGE,                               # 120
-            OUT_OF_RANGE,                               # 135
-            laser_dists[4] + SENSOR_DIST_FROM_CENTER,   # 150
-        ]
+        msg.ranges = ranges
         self.laser_publisher.publish(msg)
 
 
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from math import sin, cos, atan2
+from math import sin, cos, hypot
 import rclpy
 from rclpy.node import Node
 from rclpy.qos import DurabilityPolicy, HistoryPolicy, QoSProfile
@@ -42,6 +42,13 @@ class SimpleMapper(Node):
 
         # Init map related elements
         self.map = [-1] * MAP_WIDTH * MAP_HEIGHT
+        self.map_message = OccupancyGrid()
+        self.map_message.header.frame_id = 'map'
+        self.map_message.info.resolution = RESOLUTION
+        self.map_message.info.width = MAP_WIDTH
+        self.map_message.info.height = MAP_HEIGHT
+        self.map_message.info.origin.position.x = WORLD_ORIGIN_X
+        self.map_message.info.origin.position.y = WORLD_ORIGIN_Y
         self.map_publisher = self.create_publisher(
             OccupancyGrid,
             '/map',
@@ -74,43 +81,56 @@ class SimpleMapper(Node):
     def publish_map(self):
         now = self.get_clock().now()
 
-        msg = OccupancyGrid()
+        msg = self.map_message
         msg.header.stamp = now.to_msg()
-        msg.header.frame_id = 'map'
-        msg.info.resolution = RESOLUTION
-        msg.info.width = MAP_WIDTH
-        msg.info.height = MAP_HEIGHT
-        msg.info.origin.position.x = WORLD_ORIGIN_X
-        msg.info.origin.position.y = WORLD_ORIGIN_Y
         msg.data = self.map
         self.map_publisher.publish(msg)
 
     def update_map(self, msg):
         # Determine transformation of laser and robot in respect to odometry
-        laser_rotation = None
+        laser_rotation_cos = None
+        laser_rotation_sin = None
         laser_translation = None
         try:
             tf = self.tf_buffer.lookup_transform('odom', msg.header.frame_id, Time(sec=0, nanosec=0))
             q = tf.transform.rotation
-            laser_rotation = atan2(2.0 * (q.w * q.z + q.x * q.y), 1.0 - 2.0 * (q.y * q.y + q.z * q.z))
+            laser_rotation_cos = 1.0 - 2.0 * (q.y * q.y + q.z * q.z)
+            laser_rotation_sin = 2.0 * (q.w * q.z + q.x * q.y)
             laser_translation = tf.transform.translation
         except (LookupException, ConnectivityException, ExtrapolationException) as e:
             print('No required transformation found: `{}`'.format(str(e)))
             return
 
+        # Normalize the yaw direction taken from the quaternion, the yaw angle itself is never needed
+        laser_rotation_norm = hypot(laser_rotation_cos, laser_rotation_sin)
+        if laser_rotation_norm > 0:
+            laser_rotation_cos /= laser_rotation_norm
+            laser_rotation_sin /= laser_rotation_norm
+        else:
+            laser_rotation_cos = 1.0
+            laser_rotation_sin = 0.0
+
         # Determine position of robot and laser
         world_robot_x = laser_translation.x + WORLD_ORIGIN_X
         world_robot_y = laser_translation.y + WORLD_ORIGIN_Y
         world_laser_xs = []
         world_laser_ys = []
-        laser_range_angle = msg.angle_min + laser_rotation
+        # The beam direction is rotated by the angle increment, so sin/cos are not evaluated for each beam
+        angle_min_cos = cos(msg.angle_min)
+        angle_min_sin = sin(msg.angle_min)
+        laser_range_cos = angle_min_cos * laser_rotation_cos - angle_min_sin * laser_rotation_sin
+        laser_range_sin = angle_min_sin * laser_rotation_cos + angle_min_cos * laser_rotation_sin
+        increment_cos = cos(msg.angle_increment)
+        increment_sin = sin(msg.angle_increment)
         for laser_range in msg.ranges:
             if laser_range < msg.range_max and laser_range > msg.range_min:
-                laser_x = world_robot_x + laser_range * cos(laser_range_angle)
-                laser_y = world_robot_y + laser_range * sin(laser_range_angle)
+                laser_x = world_robot_x + laser_range * laser_range_cos
+                laser_y = world_robot_y + laser_range * laser_range_sin
                 world_laser_xs.append(laser_x)
                 world_laser_ys.append(laser_y)
-            laser_range_angle += msg.angle_increment
+            laser_range_cos, laser_range_sin = \
+                laser_range_cos * increment_cos - laser_range_sin * increment_sin, \
+                laser_range_sin * increment_cos + laser_range_cos * increment_sin
 
         # Determine position on map (from world coordinates)
         robot_x = int(world_robot_x / RESOLUTION)
@@ -39,6 +39,7 @@ class MavicDriver:
     def init(self, webots_node, properties):
         self.__robot = webots_node.robot
         self.__timestep = int(self.__robot.getBasicTimeStep())
+        self.__timestep_seconds = self.__timestep / 1000
 
         # Sensors
         self.__gps = self.__robot.getDevice('gps')
@@ -87,8 +88,9 @@ class MavicDriver:
         # Allow high level control once the drone is lifted
         if vertical > 0.2:
             # Calculate velocity
-            velocity_x = (pitch / (abs(roll) + abs(pitch))) * velocity
-            velocity_y = - (roll / (abs(roll) + abs(pitch))) * velocity
+            velocity_scale = velocity / (abs(roll) + abs(pitch))
+            velocity_x = pitch * velocity_scale
+            velocity_y = - roll * velocity_scale
 
             # High level controller (linear velocity)
             linear_y_error = self.__target_twist.linear.y - velocity_y
@@ -98,7 +100,7 @@ class MavicDriver:
             roll_ref = K_Y_VELOCITY_P * linear_y_error + K_Y_VELOCITY_I * self.__linear_y_integral
             pitch_ref = - K_X_VELOCITY_P * linear_x_error - K_X_VELOCITY_I * self.__linear_x_integral
             self.__vertical_ref = clamp(
-                self.__vertical_ref + self.__target_twist.linear.z * (self.__timestep / 1000),
+                self.__vertical_ref + self.__target_twist.linear.z * self.__timestep_seconds,
                 max(vertical - 0.5, LIFT_HEIGHT),
                 vertical + 0.5
             )